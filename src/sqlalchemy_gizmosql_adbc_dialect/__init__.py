@@ -1,16 +1,23 @@
+import copy
+import functools
+from collections import OrderedDict
+import os
 import re
+import time
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterator, List, Optional, Set, Tuple, Type
 
+import pyarrow
 import sqlalchemy.exc
 from adbc_driver_flightsql import dbapi as gizmosql, DatabaseOptions, ConnectionOptions
 from sqlalchemy import pool
 from sqlalchemy import types as sqltypes
 from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
 from .sqlalchemy_interfaces import ReflectedColumn, ReflectedPrimaryKeyConstraint, ReflectedForeignKeyConstraint, \
     ReflectedCheckConstraint
 from sqlalchemy.engine.url import URL
-from adbc_driver_manager import OperationalError
+from adbc_driver_manager import AdbcStatusCode, OperationalError
 
 
 __version__ = "0.0.22"
@@ -19,26 +26,406 @@ if TYPE_CHECKING:
     from sqlalchemy.base import Connection
     from sqlalchemy.engine.interfaces import _IndexDict
 
+_CACHE_MISS = object()
+
+# Flight SQL errors meaning the server or transport went away - the driver reports gRPC UNAVAILABLE as IO
+_DISCONNECT_STATUS_CODES = (AdbcStatusCode.IO,)
+_DISCONNECT_MESSAGES = (
+    "Unavailable",
+    "transport is closing",
+    "connection refused",
+    "connection reset",
+    "broken pipe",
+    "error reading from server",
+)
+
+# Maximum number of prepared statements kept per connection
+_PREPARED_CURSOR_CACHE_SIZE = 128
+
+# Map database-specific data types to SQLAlchemy types
+_TYPE_MAP: Dict[str, Type[sqltypes.TypeEngine]] = {
+    "VARCHAR": sqltypes.String,
+    "INTEGER": sqltypes.Integer,
+    "DATE": sqltypes.Date,
+    "DATETIME": sqltypes.DateTime,
+    "TIMESTAMP": sqltypes.TIMESTAMP,
+    "TIME": sqltypes.TIME,
+    "BIGINT": sqltypes.BigInteger,
+    "TINYINT": sqltypes.SmallInteger,
+    "DOUBLE": sqltypes.Float,
+    "BOOLEAN": sqltypes.Boolean,
+}
+_DECIMAL_RE = re.compile(r"^DECIMAL")
+_STRUCT_RE = re.compile(r"^STRUCT")
+
+# An executemany() INSERT that bulk ingestion can stand in for: INSERT INTO [schema.]table (columns) VALUES (?, ...)
+_IDENTIFIER = r'(?:"[^"]+"|\w+)'
+_INSERT_RE = re.compile(
+    rf"^\s*INSERT\s+INTO\s+(?:({_IDENTIFIER})\s*\.\s*)?({_IDENTIFIER})\s*\(([^)]+)\)"
+    r"\s*VALUES\s*\((\s*\?(?:\s*,\s*\?)*\s*)\)\s*$",
+    re.IGNORECASE,
+)
+
+# Catches DDL issued as plain text (e.g. via text()), which SQLAlchemy doesn't flag as DDL
+_DDL_RE = re.compile(r"^\s*(CREATE|ALTER|DROP|ATTACH|DETACH)\b", re.IGNORECASE)
+
+
+# Reflection queries - the batched ones format their table_name IN (...) list with one ? per table
+_SQL_SCHEMAS = """
+    SELECT DISTINCT table_schema AS schema_name
+      FROM information_schema.tables
+     WHERE table_catalog = current_database()
+     ORDER BY 1 ASC
+"""
+
+_SQL_TABLES = """
+    SELECT table_name
+      FROM information_schema.tables
+     WHERE table_catalog = current_database()
+       AND table_type = 'BASE TABLE'
+       AND table_schema = ?
+    ORDER BY 1 ASC
+"""
+
+_SQL_COLUMNS = """
+    SELECT table_name
+         , column_name
+         , data_type
+         , is_nullable
+         , column_default
+      FROM information_schema.columns
+     WHERE table_catalog = current_database()
+       AND table_schema = ?
+       {table_filter}
+    ORDER BY table_name ASC
+           , ordinal_position ASC
+"""
+
+_SQL_VIEWS = """
+    SELECT table_name
+      FROM information_schema.tables
+     WHERE table_catalog = current_database()
+       AND table_type = 'VIEW'
+       AND table_schema = ?
+     ORDER BY 1
+"""
+
+_SQL_RELATIONS = """
+    SELECT table_name
+      FROM information_schema.tables
+     WHERE table_catalog = current_database()
+       AND table_schema = ?
+"""
+
+_SQL_HAS_TABLE = """
+    SELECT EXISTS (SELECT 1
+                     FROM information_schema.tables
+                    WHERE table_catalog = current_database()
+                      AND table_schema = ?
+                      AND table_name = ?
+                  ) AS table_exists
+"""
+
+_SQL_PK = """
+    SELECT table_name
+         , constraint_name
+         , constraint_column_names
+      FROM duckdb_constraints()
+     WHERE constraint_type = 'PRIMARY KEY'
+       AND database_name = current_database()
+       AND schema_name = ?
+       {table_filter}
+"""
+
+_SQL_FK = """
+    SELECT
+         table_name                AS fk_table_name
+       , referenced_table          AS pk_table_name
+       , constraint_name
+       , constraint_column_names   AS constrained_columns
+       , schema_name               AS referred_schema
+       , referenced_table          AS referred_table
+       , referenced_column_names   AS referred_columns
+    FROM duckdb_constraints()
+    WHERE constraint_type = 'FOREIGN KEY'
+      AND database_name = current_database()
+      AND schema_name = ?
+      {table_filter}
+    ORDER BY table_name ASC
+           , constraint_name ASC
+"""
+
+_SQL_CHECK = """
+    SELECT table_name
+         , constraint_name
+         , expression AS sqltext
+    FROM duckdb_constraints()
+    WHERE constraint_type = 'CHECK'
+      AND database_name = current_database()
+      AND schema_name = ?
+      {table_filter}
+"""
+
+
+def _schema_or_main(schema: Optional[str]) -> str:
+    return "main" if schema is None else schema
+
+
+@functools.lru_cache(maxsize=256)
+def _get_column_type(data_type: str) -> Type[sqltypes.TypeEngine]:
+    # Map database-specific data types to SQLAlchemy types - memoized, as a database has few distinct type strings
+    column_type = _TYPE_MAP.get(data_type)
+    if column_type is not None:
+        return column_type
+    elif _DECIMAL_RE.match(data_type):
+        return sqltypes.Numeric
+    elif _STRUCT_RE.match(data_type):
+        return sqltypes.JSON
+    else:
+        # Try a catch-all for any other data types
+        try:
+            return getattr(sqltypes, data_type)
+        except AttributeError:
+            raise ValueError(f"Unsupported column type: {data_type}")
+
+
+def _as_bool(value: Any) -> bool:
+    # URL query args arrive as strings, but connect_args may pass real booleans
+    if isinstance(value, bool):
+        return value
+    return (value or "False").lower() == "true"
+
+
+def _rpc_headers(options: Dict[str, Any]) -> Dict[str, Any]:
+    return {f"{ConnectionOptions.RPC_CALL_HEADER_PREFIX.value}{key}": value for key, value in options.items()}
+
+
+def _cache_reflection(fn: Any) -> Any:
+    """Serve a reflection method from the dialect's TTL cache, keyed by method name and schema."""
+    @functools.wraps(fn)
+    def wrapper(self: "GizmoSQLDialect", connection: "Connection", schema: Optional[str] = None, **kw: Any) -> Any:
+        # The inspector passes schema positionally and this dialect by keyword - both must share one entry
+        key = (fn.__name__, schema)
+        return self._cached(key, lambda: fn(self, connection, schema=schema, **kw))
+
+    return wrapper
+
+
+def _drain(cur: gizmosql.Cursor) -> None:
+    """Consume a cursor's pending result stream (completing its execution) without converting rows to Python."""
+    if cur.description is None:
+        return
+
+    for _ in cur.fetch_record_batch():
+        pass
+
+
+def _unquote(identifier: str) -> str:
+    identifier = identifier.strip()
+    return identifier[1:-1] if identifier.startswith('"') else identifier
+
 
 class GizmoSQLWarning(Warning):
     pass
 
 
+class GizmoSQLQueuePool(pool.QueuePool):
+    """A QueuePool whose sizing defaults suit concurrent GizmoSQL workloads.
+
+    Defaults can be set with the GIZMOSQL_POOL_SIZE, GIZMOSQL_MAX_OVERFLOW, GIZMOSQL_POOL_TIMEOUT and
+    GIZMOSQL_POOL_RECYCLE environment variables - any pool arguments passed to create_engine() still win.
+    """
+
+    def __init__(
+            self,
+            creator: Any,
+            pool_size: Optional[int] = None,
+            max_overflow: Optional[int] = None,
+            timeout: Optional[float] = None,
+            recycle: Optional[int] = None,
+            pre_ping: bool = True,
+            **kw: Any,
+    ) -> None:
+        super().__init__(creator,
+                         pool_size=pool_size if pool_size is not None else int(os.getenv("GIZMOSQL_POOL_SIZE", "20")),
+                         max_overflow=max_overflow if max_overflow is not None else int(os.getenv("GIZMOSQL_MAX_OVERFLOW", "30")),
+                         timeout=timeout if timeout is not None else float(os.getenv("GIZMOSQL_POOL_TIMEOUT", "30")),
+                         recycle=recycle if recycle is not None else int(os.getenv("GIZMOSQL_POOL_RECYCLE", "1800")),
+                         pre_ping=pre_ping,
+                         **kw
+                         )
+
+
+class CursorWrapper:
+    """Hands SQLAlchemy a cursor that borrows a prepared ADBC cursor for each statement from its connection.
+
+    ADBC only re-prepares a cursor's statement when its SQL text changes, so running a repeated statement on
+    the cursor that last ran it skips the Flight SQL prepare round-trip.
+    """
+    __slots__ = ("_connection", "_statement", "_cursor", "_exhausted", "_rowcount", "_description", "_closed")
+    _statement: Optional[str]
+    _cursor: Optional[gizmosql.Cursor]
+
+    def __init__(self, connection: "ConnectionWrapper") -> None:
+        self._connection = connection
+        self._statement = None
+        self._cursor = None
+        self._exhausted = True
+        # Kept from the last execution, as SQLAlchemy may read them after the cursor has gone back to the cache
+        self._rowcount = -1
+        self._description = None
+        self._closed = False
+
+    def execute(self, operation: str, parameters: Optional[Any] = None) -> None:
+        self._borrow(operation)
+        self._cursor.execute(operation, parameters)
+        self._executed()
+
+    def executemany(self, operation: str, seq_of_parameters: Any) -> None:
+        self._borrow(operation)
+        self._cursor.executemany(operation, seq_of_parameters)
+        self._executed()
+
+    @property
+    def rowcount(self) -> int:
+        return self._rowcount
+
+    @property
+    def description(self) -> Optional[List[Tuple]]:
+        return self._description
+
+    def fetchone(self) -> Optional[Tuple]:
+        row = self._cursor.fetchone()
+        if row is None:
+            self._exhausted = True
+        return row
+
+    def fetchmany(self, size: Optional[int] = None) -> List[Tuple]:
+        rows = self._cursor.fetchmany(size)
+        if len(rows) < (size if size is not None else self._cursor.arraysize):
+            self._exhausted = True
+        return rows
+
+    def fetchall(self) -> List[Tuple]:
+        self._exhausted = True
+        return self._cursor.fetchall()
+
+    def fetch_arrow_table(self) -> Any:
+        self._exhausted = True
+        return self._cursor.fetch_arrow_table()
+
+    def fetch_record_batch(self) -> Any:
+        self._exhausted = True
+        return self._cursor.fetch_record_batch()
+
+    @property
+    def connection(self) -> "ConnectionWrapper":
+        return self._connection
+
+    def close(self) -> None:
+        self._release()
+        self._closed = True
+
+    def __enter__(self) -> "CursorWrapper":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if self._cursor is None:
+            self._check_open()
+            self._cursor = self._connection._checkout_cursor(None)
+        return getattr(self._cursor, name)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise gizmosql.ProgrammingError("Cursor is closed", status_code=AdbcStatusCode.INVALID_STATE)
+
+    def _executed(self) -> None:
+        self._rowcount = self._cursor.rowcount
+        self._description = self._cursor.description
+        self._exhausted = self._description is None
+
+    def _borrow(self, operation: str) -> None:
+        self._check_open()
+        if self._cursor is None or operation != self._statement:
+            self._release()
+            self._cursor = self._connection._checkout_cursor(operation)
+            self._statement = operation
+
+    def _release(self) -> None:
+        if self._cursor is not None:
+            # A cursor with unread results would keep its server-side stream open while cached, so close it instead
+            self._connection._checkin_cursor(self._statement if self._exhausted else None, self._cursor)
+            self._statement = None
+            self._cursor = None
+            self._exhausted = True
+
+
 class ConnectionWrapper:
-    __c: "Connection"
+    # Slots keep per-connection wrappers small; __getattr__ still forwards anything not defined here
+    __slots__ = ("_c", "notices", "native_transactions", "autocommit", "closed", "_cursor",
+                 "_prep_cache", "_on_ddl", "_ddl_pending", "__weakref__")
+    _c: "Connection"
     notices: List[str]
-    autocommit = None
-    closed = False
-
-    def __init__(self, c: gizmosql.Connection) -> None:
-        self.__c = c
+    native_transactions: bool
+    autocommit: Optional[bool]
+    closed: bool
+
+    def __init__(self,
+                 c: gizmosql.Connection,
+                 native_transactions: bool = False,
+                 on_ddl: Optional[Callable[[], None]] = None,
+                 ) -> None:
+        self._c = c
         self.notices = list()
-
-    def cursor(self) -> gizmosql.Cursor:
-        return self.__c.cursor()
+        # Whether the driver manages transactions (autocommit off), so commit/rollback go through ADBC not SQL
+        self.native_transactions = native_transactions
+        self.autocommit = None
+        self.closed = False
+        # Long-lived cursor for statements whose results are discarded - saves allocating a statement handle
+        # per call. Like the connection itself (DB-API threadsafety 1), it must not be shared across threads.
+        self._cursor = c.cursor()
+        # Idle cursors keyed by the statement they last prepared, least recently used first
+        self._prep_cache: "OrderedDict[str, gizmosql.Cursor]" = OrderedDict()
+        # Called when this connection runs DDL, and again when the transaction holding that DDL ends - other
+        # connections can't see uncommitted DDL, so anything they reflect in between must be dropped too
+        self._on_ddl = on_ddl
+        self._ddl_pending = False
+
+    def _note_ddl(self) -> None:
+        # Statements prepared before the DDL may have a result schema it just changed, so prepare them afresh
+        self._clear_prep_cache()
+        self._ddl_pending = True
+        if self._on_ddl is not None:
+            self._on_ddl()
+
+    def _end_transaction(self) -> None:
+        if self._ddl_pending:
+            self._ddl_pending = False
+            if self._on_ddl is not None:
+                self._on_ddl()
+
+    def cursor(self) -> CursorWrapper:
+        return CursorWrapper(self)
+
+    def _checkout_cursor(self, statement: Optional[str]) -> gizmosql.Cursor:
+        cur = self._prep_cache.pop(statement, None) if statement is not None else None
+        return cur if cur is not None else self._c.cursor()
+
+    def _checkin_cursor(self, statement: Optional[str], cur: gizmosql.Cursor) -> None:
+        if statement is None or statement in self._prep_cache:
+            cur.close()
+            return
+
+        self._prep_cache[statement] = cur
+        if len(self._prep_cache) > _PREPARED_CURSOR_CACHE_SIZE:
+            _, evicted = self._prep_cache.popitem(last=False)
+            evicted.close()
 
     def fetchmany(self, size: Optional[int] = None) -> List:
-        return self.__c.fetchmany(size)
+        return self._c.fetchmany(size)
 
     @property
     def c(self) -> "Connection":
@@ -46,21 +433,71 @@ class ConnectionWrapper:
             "Directly accessing the internal connection object is deprecated (please go via the __getattr__ impl)",
             DeprecationWarning,
         )
-        return self.__c
+        return self._c
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self.__c, name)
+        # Fallback for anything not forwarded explicitly below
+        return getattr(self._c, name)
+
+    def commit(self) -> None:
+        try:
+            self._c.commit()
+        finally:
+            self._end_transaction()
+
+    def rollback(self) -> None:
+        try:
+            self._c.rollback()
+        finally:
+            self._end_transaction()
+
+    def adbc_get_info(self) -> Dict[Any, Any]:
+        return self._c.adbc_get_info()
+
+    def adbc_get_objects(self, *args: Any, **kwargs: Any) -> Any:
+        return self._c.adbc_get_objects(*args, **kwargs)
+
+    def adbc_get_table_schema(self, *args: Any, **kwargs: Any) -> Any:
+        return self._c.adbc_get_table_schema(*args, **kwargs)
+
+    def adbc_get_table_types(self) -> List[str]:
+        return self._c.adbc_get_table_types()
+
+    @property
+    def adbc_current_catalog(self) -> str:
+        return self._c.adbc_current_catalog
+
+    @property
+    def adbc_current_db_schema(self) -> str:
+        return self._c.adbc_current_db_schema
+
+    @property
+    def adbc_connection(self) -> Any:
+        return self._c.adbc_connection
+
+    @property
+    def adbc_database(self) -> Any:
+        return self._c.adbc_database
 
     @property
     def connection(self) -> "Connection":
+        # A property rather than an attribute set to self, which would make every wrapper a reference cycle
         return self
 
+    def _clear_prep_cache(self) -> None:
+        while self._prep_cache:
+            _, cur = self._prep_cache.popitem()
+            cur.close()
+
     def close(self) -> None:
-        self.__c.close()
+        self._clear_prep_cache()
+        self._cursor.close()
+        self._c.close()
+        self.closed = True
 
     @property
     def rowcount(self) -> int:
-        return self.cursor().rowcount
+        return self._cursor.rowcount
 
     def executemany(
             self,
@@ -68,9 +505,8 @@ class ConnectionWrapper:
             parameters: Optional[List[Dict]] = None,
             context: Optional[Any] = None,
     ) -> None:
-        with self.cursor() as cur:
-            cur.executemany(statement, parameters)
-            _ = cur.fetchall()
+        self._cursor.executemany(statement, parameters)
+        _drain(self._cursor)
 
     def execute(
             self,
@@ -79,16 +515,18 @@ class ConnectionWrapper:
             context: Optional[Any] = None,
     ) -> None:
         try:
-            if statement.lower() == "commit":  # this is largely for ipython-sql
-                self.__c.commit()
-            elif statement.lower() == "register":
+            # Only lower-case statements that could be one of the sentinels, rather than copying every SQL text
+            lowered = statement.lower() if len(statement) <= 8 else None
+            if lowered == "commit":  # this is largely for ipython-sql
+                self.commit()
+            elif lowered == "register":
                 assert parameters and len(parameters) == 2, parameters
                 view_name, df = parameters
-                self.__c.register(view_name, df)
+                self._c.register(view_name, df)
             else:
-                with self.__c.cursor() as cur:
-                    cur.execute(statement, parameters)
-                    _ = cur.fetchall()
+                if _DDL_RE.match(statement):
+                    self._note_ddl()
+                self._execute_and_drain(statement, parameters)
         except RuntimeError as e:
             if e.args[0].startswith("Not implemented Error"):
                 raise NotImplementedError(*e.args) from e
@@ -100,6 +538,10 @@ class ConnectionWrapper:
             else:
                 raise e
 
+    def _execute_and_drain(self, statement: str, parameters: Optional[Tuple] = None) -> None:
+        self._cursor.execute(statement, parameters)
+        _drain(self._cursor)
+
 
 class GizmoSQLDialect(DefaultDialect):
     name = "gizmosql"
@@ -110,51 +552,85 @@ class GizmoSQLDialect(DefaultDialect):
     supports_sane_rowcount = False
     supports_server_side_cursors = False
     postfetch_lastrowid = False
+    use_insertmanyvalues = True
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
+        # Reflection results as (time fetched, value) - a TTL of 0 disables the cache
+        self._reflect_cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._reflect_cache_ttl = float(os.getenv("GIZMOSQL_REFLECTION_CACHE_TTL", "60"))
+        # Bumped on every invalidation, so a reflection that was in flight across DDL doesn't store stale results
+        self._reflect_generation = 0
+        # Table and view names per schema, shared by has_table() calls within the same TTL window
+        self._tables_cache: Dict[Optional[str], Tuple[float, Set[str]]] = {}
+        # Opt-in, as bulk ingestion needs a driver and server that support it
+        self._bulk_ingest = os.getenv("GIZMOSQL_BULK_INGEST", "false").lower() == "true"
+        # Target table schemas for bulk ingestion, dropped along with the reflection cache on DDL
+        self._ingest_schemas: Dict[Tuple[Optional[str], str], pyarrow.Schema] = {}
+
+    def _cached(self, key: Tuple, fn: Any) -> Any:
+        value = self._cache_get(key)
+        if value is _CACHE_MISS:
+            generation = self._reflect_generation
+            value = fn()
+            self._cache_put(key, value, generation)
+
+        return value
+
+    def _cache_get(self, key: Tuple) -> Any:
+        entry = self._reflect_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self._reflect_cache_ttl:
+            return _CACHE_MISS
+
+        # SQLAlchemy mutates reflected structures (e.g. instantiating column types), so never hand out the cached value
+        return copy.deepcopy(entry[1])
+
+    def _cache_put(self, key: Tuple, value: Any, generation: int) -> None:
+        if self._reflect_cache_ttl > 0 and generation == self._reflect_generation:
+            self._reflect_cache[key] = (time.monotonic(), copy.deepcopy(value))
+
+    def _invalidate_reflection_cache(self) -> None:
+        self._reflect_generation += 1
+        self._reflect_cache.clear()
+        self._tables_cache.clear()
+        self._ingest_schemas.clear()
 
     def create_connect_args(self, url):
         opts = url.translate_connect_args()
-        username = opts.get('username', None)
-        password = opts.get('password', None)
-        host = opts.get('host', None)
-        port = opts.get('port', None)
-        database = opts.get('database', None)
 
         # Get Query parameters
         query_dict = dict(url.query)
-        use_encryption = query_dict.pop('useEncryption', None)
-        disable_certificate_verification = query_dict.pop('disableCertificateVerification', None)
+        use_encryption = _as_bool(query_dict.pop('useEncryption', None))
+        disable_certificate_verification = _as_bool(query_dict.pop('disableCertificateVerification', None))
+
+        # The endpoint and credentials stay separate keys, so connect_args given to create_engine() can override
+        # them - only the remaining query args are turned into connection kwargs (RPC headers) up front
         args = dict()
-        kwargs = dict(host=host,
-                      port=port,
-                      database=database,
-                      username=username,
-                      password=password,
+        kwargs = dict(host=opts.get('host', None),
+                      port=opts.get('port', None),
+                      database=opts.get('database', None),
+                      username=opts.get('username', None),
+                      password=opts.get('password', None),
                       use_encryption=use_encryption,
                       disable_certificate_verification=disable_certificate_verification,
-                      **query_dict
+                      conn_kwargs=_rpc_headers(query_dict)
                       )
 
-        # Assuming the connection arguments for your custom DB
         return (args, kwargs)
 
-    def connect(self, *args, **kwargs) -> "Connection":
+    def connect(self, *args, conn_kwargs: Optional[Dict[str, str]] = None, **kwargs) -> "Connection":
         protocol: str = "grpc"
 
-        use_encryption: bool = (kwargs.pop("use_encryption", "False") or "False").lower() == "true"
-
-        if use_encryption:
+        if _as_bool(kwargs.pop("use_encryption", None)):
             protocol += "+tls"
 
-        disable_certificate_verification: bool = (kwargs.pop("disable_certificate_verification", "False") or "False").lower() == "true"
+        disable_certificate_verification = _as_bool(kwargs.pop("disable_certificate_verification", None))
 
         uri = f"{protocol}://{kwargs.pop('host')}:{kwargs.pop('port')}"
 
         database = kwargs.pop('database', None)
-        username = kwargs.pop('username')
-        password = kwargs.pop('password')
+        username = kwargs.pop('username', None)
+        password = kwargs.pop('password', None)
 
         db_kwargs = {DatabaseOptions.TLS_SKIP_VERIFY.value: str(disable_certificate_verification).lower()}
 
@@ -165,27 +641,30 @@ class GizmoSQLDialect(DefaultDialect):
         if password is not None:
             db_kwargs["password"] = password
 
-        # Add any remaining query args as connection kwargs (RPC headers)
-        conn_kwargs = dict()
-        for key, value in kwargs.items():
-            conn_kwargs[f"{ConnectionOptions.RPC_CALL_HEADER_PREFIX.value}{key}"] = value
+        # Any other connect_args given to create_engine() are sent as RPC headers too
+        conn_kwargs = {**(conn_kwargs or {}), **_rpc_headers(kwargs)}
 
         conn = gizmosql.connect(uri=uri,
                                 db_kwargs=db_kwargs,
                                 conn_kwargs=conn_kwargs
                                 )
 
-        # Add a notices attribute for the PostgreSQL / DuckDB dialect...
-        setattr(conn, "notices", ["n/a"])
+        # The driver already tried to turn autocommit off when connecting. Where that worked it keeps a transaction
+        # open, so begin is implicit and commit/rollback are ADBC calls rather than statements - servers without
+        # Flight SQL transactions fall back to SQL
+        native_transactions = getattr(conn, "_commit_supported", False)
 
-        return ConnectionWrapper(conn)
+        return ConnectionWrapper(conn,
+                                 native_transactions=native_transactions,
+                                 on_ddl=self._invalidate_reflection_cache
+                                 )
 
     def on_connect(self) -> None:
         pass
 
     @classmethod
     def get_pool_class(cls, url: URL) -> Type[pool.Pool]:
-        return pool.QueuePool
+        return GizmoSQLQueuePool
 
     @classmethod
     def import_dbapi(cls):
@@ -201,47 +680,124 @@ class GizmoSQLDialect(DefaultDialect):
     def get_default_isolation_level(self, connection: "Connection") -> None:
         raise NotImplementedError()
 
+    def is_disconnect(self, e: Exception, connection: Any, cursor: Any) -> bool:
+        # Lets pool_pre_ping and error handling recycle connections the server has dropped
+        if not isinstance(e, gizmosql.Error):
+            return False
+        if getattr(e, "status_code", None) in _DISCONNECT_STATUS_CODES:
+            return True
+
+        message = str(e).lower()
+        return any(fragment.lower() in message for fragment in _DISCONNECT_MESSAGES)
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        if not self._ingest(cursor, statement, parameters):
+            cursor.executemany(statement, parameters)
+
+    def _ingest(self, cursor: CursorWrapper, statement: str, parameters: Any) -> bool:
+        """Run a plain positional INSERT executemany() as a single Arrow bulk ingestion - one Flight SQL call instead
+        of a bind and execute per row. Returns False, having done nothing, if the fast path can't be used."""
+        # Only a list of rows can be inspected without consuming it before the fallback runs
+        if not self._bulk_ingest or not isinstance(parameters, (list, tuple)) or not parameters:
+            return False
+
+        match = _INSERT_RE.match(statement)
+        if match is None:
+            return False
+
+        schema, table, column_list, placeholders = match.groups()
+        schema = _unquote(schema) if schema is not None else None
+        table = _unquote(table)
+        columns = [_unquote(column) for column in column_list.split(",")]
+        if placeholders.count("?") != len(columns):
+            return False
+        if any(not isinstance(row, (list, tuple)) or len(row) != len(columns) for row in parameters):
+            return False
+
+        # Ingestion appends whole rows, so every column must be given - otherwise defaults and sequences would be
+        # skipped. Building the batch with the table's own types also keeps Arrow from inferring different ones.
+        target = self._ingest_schema(cursor.connection, schema, table)
+        if target is None or len(columns) != len(target.names) or set(columns) != set(target.names):
+            return False
+
+        try:
+            data = pyarrow.table([pyarrow.array(values, type=target.field(column).type)
+                                  for column, values in zip(columns, zip(*parameters))
+                                  ],
+                                 names=columns
+                                 ).select(target.names)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+            return False
+
+        try:
+            cursor.adbc_ingest(table, data, mode="append", db_schema_name=schema)
+        except gizmosql.NotSupportedError:
+            # The server or driver can't ingest - don't keep trying
+            self._bulk_ingest = False
+            return False
+
+        return True
+
+    def _ingest_schema(self, connection: ConnectionWrapper, schema: Optional[str], table: str) -> Any:
+        key = (schema, table)
+        if key not in self._ingest_schemas:
+            generation = self._reflect_generation
+            try:
+                target = connection.adbc_get_table_schema(table, db_schema_filter=schema)
+            except gizmosql.Error:
+                return None
+            if generation == self._reflect_generation:
+                self._ingest_schemas[key] = target
+            return target
+
+        return self._ingest_schemas[key]
+
     def do_execute(self, cursor, statement, parameters, context=None):
+        if context.isddl or _DDL_RE.match(statement):
+            cursor.connection._note_ddl()
+
         cursor.execute(statement, parameters)
         if context.isddl or context.compiled.statement.is_dml:
-            _ = cursor.fetchall()
+            _drain(cursor)
 
     def do_rollback(self, connection: "Connection") -> None:
-        with connection.cursor() as cur:
-            cur.execute("rollback")
-            try:
-                _ = cur.fetchall()
-            except OperationalError as e:
-                if "TransactionContext Error: cannot rollback - no transaction is active" in e.args[0]:
-                    pass
+        try:
+            if connection.native_transactions:
+                connection.rollback()
+            else:
+                connection._execute_and_drain("rollback")
+        except OperationalError as e:
+            if "TransactionContext Error: cannot rollback - no transaction is active" not in str(e):
+                raise
+        finally:
+            connection._end_transaction()
 
     def do_begin(self, connection: "Connection") -> None:
-        with connection.cursor() as cur:
-            cur.execute("begin")
-            _ = cur.fetchall()
+        if not connection.native_transactions:
+            connection._execute_and_drain("begin")
 
     def do_commit(self, connection: "Connection") -> None:
-        with connection.cursor() as cur:
-            cur.execute("commit")
-            _ = cur.fetchall()
+        try:
+            if connection.native_transactions:
+                connection.commit()
+            else:
+                connection._execute_and_drain("commit")
+        finally:
+            connection._end_transaction()
 
+    @_cache_reflection
     def get_schema_names(
             self,
             connection: "Connection",
             **kw: Any,
     ) -> Any:
-        s = """
-            SELECT DISTINCT table_schema AS schema_name
-              FROM information_schema.tables
-             WHERE table_catalog = current_database()
-             ORDER BY 1 ASC
-            """
         with connection.connection.cursor() as cur:
-            cur.execute(operation=s)
-            rs = cur.fetchall()
+            cur.execute(operation=_SQL_SCHEMAS)
+            tbl = cur.fetch_arrow_table()
 
-        return [row[0] for row in rs]
+        return tbl.column(0).to_pylist()
 
+    @_cache_reflection
     def get_table_names(
             self,
             connection: "Connection",
@@ -249,19 +805,11 @@ class GizmoSQLDialect(DefaultDialect):
             include: Optional[Any] = None,
             **kw: Any,
     ) -> Any:
-        s = """
-            SELECT table_name 
-              FROM information_schema.tables
-             WHERE table_catalog = current_database()
-               AND table_type = 'BASE TABLE'
-               AND table_schema = ?
-            ORDER BY 1 ASC
-            """
         with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main"])
-            rs = cur.fetchall()
+            cur.execute(operation=_SQL_TABLES, parameters=[_schema_or_main(schema)])
+            tbl = cur.fetch_arrow_table()
 
-        return [row[0] for row in rs]
+        return tbl.column(0).to_pylist()
 
     def get_columns(
             self,
@@ -270,69 +818,35 @@ class GizmoSQLDialect(DefaultDialect):
             schema: Optional[str] = None,
             **kw: Any,
     ) -> List[ReflectedColumn]:
-        s = """
-            SELECT column_name
-                 , data_type
-                 , is_nullable
-                 , column_default
-              FROM information_schema.columns
-             WHERE table_catalog = current_database()
-               AND table_schema = ?
-               AND table_name = ?
-            ORDER BY ordinal_position ASC
-            """
-        with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main",
-                                                 table_name
-                                                 ]
-                        )
-            rs = cur.fetchall()
-
-        columns = []
-        for column_name, data_type, is_nullable, column_default in rs:
-            columns.append(ReflectedColumn(name=column_name,
-                                           type=self._get_column_type(data_type=data_type),
-                                           nullable=(is_nullable == "YES"),
-                                           default=column_default
-                                           )
-                           )
-
-        return columns
+        return self._reflect_single_table(self.get_multi_columns, connection, table_name, schema, **kw)
+
+    def get_multi_columns(
+            self,
+            connection: "Connection",
+            *,
+            schema: Optional[str] = None,
+            filter_names: Optional[Collection[str]] = None,
+            scope: ObjectScope = ObjectScope.DEFAULT,
+            kind: ObjectKind = ObjectKind.TABLE,
+            **kw: Any,
+    ) -> Iterator[Tuple[Tuple[Optional[str], str], List[ReflectedColumn]]]:
+        def build(rs: List[Tuple]) -> List[ReflectedColumn]:
+            get_column_type = self._get_column_type
+            return [ReflectedColumn(name=column_name,
+                                    type=get_column_type(data_type),
+                                    nullable=(is_nullable == "YES"),
+                                    default=column_default
+                                    )
+                    for column_name, data_type, is_nullable, column_default in rs
+                    ]
+
+        return self._reflect_multi("columns", _SQL_COLUMNS, build, connection, schema, filter_names, scope, kind, **kw)
 
     @staticmethod
     def _get_column_type(data_type: str):
-        # Map database-specific data types to SQLAlchemy types
-        if data_type == 'VARCHAR':
-            return sqltypes.String
-        elif data_type == 'INTEGER':
-            return sqltypes.Integer
-        elif data_type == 'DATE':
-            return sqltypes.Date
-        elif data_type == 'DATETIME':
-            return sqltypes.DateTime
-        elif data_type == "TIMESTAMP":
-            return sqltypes.TIMESTAMP
-        elif data_type == "TIME":
-            return sqltypes.TIME
-        elif data_type == "BIGINT":
-            return sqltypes.BigInteger
-        elif data_type == "TINYINT":
-            return sqltypes.SmallInteger
-        elif re.match(pattern="^DECIMAL", string=data_type):
-            return sqltypes.Numeric
-        elif data_type == "DOUBLE":
-            return sqltypes.Float
-        elif data_type == "BOOLEAN":
-            return sqltypes.Boolean
-        elif re.match(pattern="^STRUCT", string=data_type):
-            return sqltypes.JSON
-        else:
-            # Try a catch-all for any other data types
-            try:
-                return getattr(sqltypes, data_type)
-            except AttributeError:
-                raise ValueError(f"Unsupported column type: {data_type}")
+        return _get_column_type(data_type)
 
+    @_cache_reflection
     def get_view_names(
             self,
             connection: "Connection",
@@ -340,19 +854,11 @@ class GizmoSQLDialect(DefaultDialect):
             include: Optional[Any] = None,
             **kw: Any,
     ) -> Any:
-        s = """
-            SELECT table_name
-              FROM information_schema.tables
-             WHERE table_catalog = current_database()
-               AND table_type = 'VIEW'
-               AND table_schema = ?
-             ORDER BY 1
-            """
         with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main"])
-            rs = cur.fetchall()
+            cur.execute(operation=_SQL_VIEWS, parameters=[_schema_or_main(schema)])
+            tbl = cur.fetch_arrow_table()
 
-        return [row[0] for row in rs]
+        return tbl.column(0).to_pylist()
 
     def has_table(
         self,
@@ -361,21 +867,30 @@ class GizmoSQLDialect(DefaultDialect):
         schema: Optional[str] = None,
         **kw: Any,
     ) -> bool:
-        s = """
-            SELECT 1
-              FROM information_schema.tables
-             WHERE table_catalog = current_database()
-               AND table_schema = ?
-               AND table_name = ?
-            """
+        if self._reflect_cache_ttl > 0:
+            # e.g. create_all() checks every table - answer them all from one listing of the schema
+            return table_name in self._relation_names(connection, schema)
+
         with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main",
-                                                 table_name
-                                                 ]
-                        )
-            row = cur.fetchone()
+            cur.execute(operation=_SQL_HAS_TABLE, parameters=[_schema_or_main(schema), table_name])
+            tbl = cur.fetch_arrow_table()
+
+        return tbl.num_rows > 0 and bool(tbl.column(0)[0].as_py())
+
+    def _relation_names(self, connection: "Connection", schema: Optional[str]) -> Set[str]:
+        entry = self._tables_cache.get(schema)
+        if entry is None or time.monotonic() - entry[0] >= self._reflect_cache_ttl:
+            generation = self._reflect_generation
+            # Tables and views alike, in one round-trip
+            with connection.connection.cursor() as cur:
+                cur.execute(operation=_SQL_RELATIONS, parameters=[_schema_or_main(schema)])
+                tbl = cur.fetch_arrow_table()
+
+            entry = (time.monotonic(), set(tbl.column(0).to_pylist()))
+            if generation == self._reflect_generation:
+                self._tables_cache[schema] = entry
 
-        return row is not None
+        return entry[1]
 
     def get_pk_constraint(
             self,
@@ -384,29 +899,28 @@ class GizmoSQLDialect(DefaultDialect):
             schema: Optional[str] = None,
             **kw: Any,
     ) -> ReflectedPrimaryKeyConstraint:
-        return_value = None
-        s = """
-            SELECT constraint_name
-                 , constraint_column_names
-              FROM duckdb_constraints()
-             WHERE constraint_type = 'PRIMARY KEY'
-               AND database_name = current_database()
-               AND schema_name = ?
-               AND table_name = ?
-            """
-        with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main",
-                                                 table_name
-                                                 ]
-                        )
-            row = cur.fetchall()
+        return self._reflect_single_table(self.get_multi_pk_constraint, connection, table_name, schema, **kw)
+
+    def get_multi_pk_constraint(
+            self,
+            connection: "Connection",
+            *,
+            schema: Optional[str] = None,
+            filter_names: Optional[Collection[str]] = None,
+            scope: ObjectScope = ObjectScope.DEFAULT,
+            kind: ObjectKind = ObjectKind.TABLE,
+            **kw: Any,
+    ) -> Iterator[Tuple[Tuple[Optional[str], str], ReflectedPrimaryKeyConstraint]]:
+        def build(rs: List[Tuple]) -> ReflectedPrimaryKeyConstraint:
+            return_value = None
+            for constraint_name, constrained_columns in rs:
+                return_value = ReflectedPrimaryKeyConstraint(name=constraint_name,
+                                                             constrained_columns=constrained_columns
+                                                             )
 
-        for constraint_name, constrained_columns in row:
-           return_value = ReflectedPrimaryKeyConstraint(name=constraint_name,
-                                                        constrained_columns=constrained_columns
-                                                        )
+            return return_value
 
-        return return_value
+        return self._reflect_multi("pk_constraint", _SQL_PK, build, connection, schema, filter_names, scope, kind, **kw)
 
     def get_foreign_keys(
         self,
@@ -415,40 +929,32 @@ class GizmoSQLDialect(DefaultDialect):
         schema: Optional[str] = None,
         **kw: Any,
     ) -> List[ReflectedForeignKeyConstraint]:
-        return_value = []
-        s = """
-            SELECT
-                 referenced_table          AS pk_table_name
-               , table_name                AS fk_table_name
-               , constraint_name
-               , constraint_column_names   AS constrained_columns
-               , schema_name               AS referred_schema
-               , referenced_table          AS referred_table
-               , referenced_column_names   AS referred_columns
-            FROM duckdb_constraints()
-            WHERE constraint_type = 'FOREIGN KEY'
-              AND database_name = current_database()
-              AND schema_name = ?
-              AND table_name = ?
-            ORDER BY constraint_name ASC
-            """
-        with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main",
-                                                 table_name
-                                                 ]
-                        )
-            rs = cur.fetchall()
-
-        for _, _, constraint_name, constrained_columns, referred_schema, referred_table, referred_columns in rs:
-            return_value.append(ReflectedForeignKeyConstraint(name=constraint_name,
-                                                              constrained_columns=constrained_columns,
-                                                              referred_schema=referred_schema,
-                                                              referred_table=referred_table,
-                                                              referred_columns=referred_columns
-                                                              )
-                                )
+        return self._reflect_single_table(self.get_multi_foreign_keys, connection, table_name, schema, **kw)
 
-        return return_value
+    def get_multi_foreign_keys(
+            self,
+            connection: "Connection",
+            *,
+            schema: Optional[str] = None,
+            filter_names: Optional[Collection[str]] = None,
+            scope: ObjectScope = ObjectScope.DEFAULT,
+            kind: ObjectKind = ObjectKind.TABLE,
+            **kw: Any,
+    ) -> Iterator[Tuple[Tuple[Optional[str], str], List[ReflectedForeignKeyConstraint]]]:
+        def build(rs: List[Tuple]) -> List[ReflectedForeignKeyConstraint]:
+            return_value = []
+            for _, constraint_name, constrained_columns, referred_schema, referred_table, referred_columns in rs:
+                return_value.append(ReflectedForeignKeyConstraint(name=constraint_name,
+                                                                  constrained_columns=constrained_columns,
+                                                                  referred_schema=referred_schema,
+                                                                  referred_table=referred_table,
+                                                                  referred_columns=referred_columns
+                                                                  )
+                                    )
+
+            return return_value
+
+        return self._reflect_multi("foreign_keys", _SQL_FK, build, connection, schema, filter_names, scope, kind, **kw)
 
     def get_check_constraints(
         self,
@@ -457,30 +963,126 @@ class GizmoSQLDialect(DefaultDialect):
         schema: Optional[str] = None,
         **kw: Any,
     ) -> List[ReflectedCheckConstraint]:
-        return_value = []
-        s = """
-            SELECT constraint_name
-                 , expression AS sqltext
-            FROM duckdb_constraints()
-            WHERE constraint_type = 'CHECK'
-              AND database_name = current_database()
-              AND schema_name = ?
-              AND table_name = ?
-            """
-        with connection.connection.cursor() as cur:
-            cur.execute(operation=s, parameters=[schema if schema is not None else "main",
-                                                 table_name
-                                                 ]
-                        )
-            rs = cur.fetchall()
-
-        for constraint_name, sqltext in rs:
-            return_value.append(ReflectedCheckConstraint(name=constraint_name,
-                                                         sqltext=sqltext
-                                                         )
-                                )
+        return self._reflect_single_table(self.get_multi_check_constraints, connection, table_name, schema, **kw)
+
+    def get_multi_check_constraints(
+            self,
+            connection: "Connection",
+            *,
+            schema: Optional[str] = None,
+            filter_names: Optional[Collection[str]] = None,
+            scope: ObjectScope = ObjectScope.DEFAULT,
+            kind: ObjectKind = ObjectKind.TABLE,
+            **kw: Any,
+    ) -> Iterator[Tuple[Tuple[Optional[str], str], List[ReflectedCheckConstraint]]]:
+        def build(rs: List[Tuple]) -> List[ReflectedCheckConstraint]:
+            return_value = []
+            for constraint_name, sqltext in rs:
+                return_value.append(ReflectedCheckConstraint(name=constraint_name,
+                                                             sqltext=sqltext
+                                                             )
+                                    )
+
+            return return_value
+
+        return self._reflect_multi("check_constraints", _SQL_CHECK, build, connection, schema, filter_names, scope, kind, **kw)
+
+    def _reflect_single_table(
+            self,
+            multi_method: Any,
+            connection: "Connection",
+            table_name: str,
+            schema: Optional[str] = None,
+            **kw: Any,
+    ) -> Any:
+        # Taking the names as given (scope/kind ANY) means no name lookup query is needed
+        for _, value in multi_method(connection,
+                                     schema=schema,
+                                     filter_names=[table_name],
+                                     scope=ObjectScope.ANY,
+                                     kind=ObjectKind.ANY,
+                                     **kw
+                                     ):
+            return value
+
+    def _reflect_multi(
+            self,
+            name: str,
+            sql: str,
+            build: Any,
+            connection: "Connection",
+            schema: Optional[str],
+            filter_names: Optional[Collection[str]],
+            scope: ObjectScope,
+            kind: ObjectKind,
+            **kw: Any,
+    ) -> Iterator[Tuple[Tuple[Optional[str], str], Any]]:
+        """Reflect many tables with a single query, grouping its rows (keyed by a leading table_name column)
+        by table client-side, and reusing any per-table results still in the reflection cache."""
+        kw.pop("unreflectable", None)
+        table_names = self._multi_reflect_table_names(connection, schema, filter_names, scope, kind, **kw)
+
+        reflected = dict()
+        missing = []
+        for table_name in table_names:
+            value = self._cache_get((name, schema, table_name))
+            if value is _CACHE_MISS:
+                missing.append(table_name)
+            else:
+                reflected[table_name] = value
+
+        if missing:
+            generation = self._reflect_generation
+            rows_by_table = dict()
+            if filter_names:
+                table_filter = f"AND table_name IN ({', '.join(['?'] * len(missing))})"
+                parameters = [_schema_or_main(schema), *missing]
+            else:
+                # Whole-schema reflection - one fixed statement the server can keep prepared, rather than an IN
+                # list with a parameter per table; rows for tables already cached are just ignored
+                table_filter = ""
+                parameters = [_schema_or_main(schema)]
+
+            with connection.connection.cursor() as cur:
+                cur.execute(operation=sql.format(table_filter=table_filter), parameters=parameters)
+                tbl = cur.fetch_arrow_table()
+
+            for table_name, *row in zip(*(column.to_pylist() for column in tbl.columns)):
+                rows_by_table.setdefault(table_name, []).append(row)
+
+            for table_name in missing:
+                reflected[table_name] = build(rows_by_table.get(table_name, []))
+                self._cache_put((name, schema, table_name), reflected[table_name], generation)
+
+        # SQLAlchemy only iterates the multi-table results once (into a dict), so don't build another list
+        return (((schema, table_name), reflected[table_name]) for table_name in table_names)
+
+    def _multi_reflect_table_names(
+            self,
+            connection: "Connection",
+            schema: Optional[str],
+            filter_names: Optional[Collection[str]],
+            scope: ObjectScope,
+            kind: ObjectKind,
+            **kw: Any,
+    ) -> List[str]:
+        # Mirrors DefaultDialect._default_multi_reflect - GizmoSQL has no temporary or materialized view listings
+        if filter_names and scope is ObjectScope.ANY and kind is ObjectKind.ANY:
+            return list(filter_names)
+
+        table_names = []
+        if ObjectScope.DEFAULT in scope:
+            if ObjectKind.TABLE in kind:
+                table_names.extend(self.get_table_names(connection, schema=schema, **kw))
+            if ObjectKind.VIEW in kind:
+                table_names.extend(self.get_view_names(connection, schema=schema, **kw))
+
+        if filter_names:
+            filter_names = set(filter_names)
+            table_names = [table_name for table_name in table_names if table_name in filter_names]
+
+        return table_names
 
-        return return_value
     def get_indexes(
             self,
             connection: "Connection",